@@ -1,41 +1,261 @@
 import os
 import logging
+import itertools
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from operator import itemgetter
 
+import orjson
 import requests
-from flask import Flask, request, jsonify, render_template_string, Response
+from requests.adapters import HTTPAdapter
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, select_autoescape
+from markupsafe import Markup, escape
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Used for request.get_json(), jsonify() and serializing logged messages.
+    Keys are sorted like Flask's default provider, and datetimes still go
+    through Flask's default handler.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2  # orjson only supports 2-space indents
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class RingLog:
+    """Fixed-capacity log that many threads can append to concurrently.
+
+    Slots are preallocated. A writer claims the next sequence number under
+    a small lock and stores (seq, entry) in slot seq % capacity, outside the
+    lock, overwriting the oldest entry once full. The lock keeps sequence
+    numbers unique on free-threaded builds too, where itertools.count is
+    not atomic without the GIL. Readers copy the slot list in one step and
+    order the copy by sequence number.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 0:
+            raise ValueError("RingLog capacity must be non-negative")
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        self._seq = itertools.count()
+        self._seq_lock = threading.Lock()
+
+    def append(self, entry):
+        if not self._capacity:
+            return  # Like deque(maxlen=0), a zero-size log keeps nothing
+        with self._seq_lock:
+            seq = next(self._seq)
+        self._slots[seq % self._capacity] = (seq, entry)
+
+    def snapshot(self):
+        """Return the stored entries, oldest first."""
+        slots = [slot for slot in self._slots[:] if slot is not None]
+        slots.sort(key=itemgetter(0))  # Two sorted runs, so this is linear
+        return [entry for _, entry in slots]
+
+
+class LogEntry:
+    """One received or sent message in the message log.
+
+    Uses __slots__ so each entry is a small fixed-layout object rather than
+    a per-message dict. The text fields hold pre-escaped Markup, which the
+    messages template outputs without escaping again.
+    """
+
+    __slots__ = ("timestamp", "direction", "endpoint", "data_json", "status")
+
+    def __init__(self, timestamp, direction, endpoint, data_json, status=None):
+        self.timestamp = timestamp
+        self.direction = direction
+        self.endpoint = endpoint
+        self.data_json = data_json
+        self.status = status
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Compress the larger pages (messages table, log dumps) on the fly
+app.config.update(
+    COMPRESS_ALGORITHM=["br", "gzip"],
+    COMPRESS_ALGORITHM_STREAMING=["br"],
+    COMPRESS_MIN_SIZE=1024,
+)
+Compress(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-KOYEB_API_BASE = "https://app.koyeb.com/v1"
+# The HTML pages are module-level strings, so they get their own Jinja
+# environment: templates are loaded by name so the bytecode cache can skip
+# recompiling them on restart, and never checked for changes.
+template_sources = {}
+jinja_env = Environment(
+    loader=DictLoader(template_sources),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+
+def compile_template(name, source):
+    """Register a template source under name and return it compiled."""
+    template_sources[name] = source
+    return jinja_env.get_template(name)
 
-message_log = []
-logs_storage = {}  # Dict to store logs by app_name
+
+KOYEB_API_BASE = "https://app.koyeb.com/v1"
+KOYEB_API_TOKEN = os.environ.get("KOYEB_API_TOKEN")  # Read once at startup
+KOYEB_TIMEOUT = 30  # Seconds before a Koyeb API call gives up
+APP_ID_TTL = 60  # Seconds a resolved app ID is reused before asking Koyeb again
+LOG_POLL_INTERVAL = int(os.environ.get("LOG_POLL_INTERVAL", 60))  # 0 disables polling
+LOG_POLL_MAX_FAILURES = 5  # Consecutive failed polls before a poller gives up
+POLLED_SOURCES = ("init", "koyeb_api")  # Entries the log poller may overwrite
+
+MESSAGE_LOG_SIZE = int(os.environ.get("MESSAGE_LOG_SIZE", 10000))
+LOGS_STORAGE_SIZE = int(os.environ.get("LOGS_STORAGE_SIZE", 500))
+LOGS_STORAGE_SHARDS = 16
+
+message_log = RingLog(MESSAGE_LOG_SIZE)  # Oldest messages drop off when full
+
+# Logs by app_name, split across shards that each have their own lock so
+# writers for different apps don't contend. Each shard maps
+# app_name -> (first_seen, entry). Once more than LOGS_STORAGE_SIZE apps are
+# stored in total, the app with the smallest first_seen is evicted.
+logs_shards = [(OrderedDict(), threading.Lock()) for _ in range(LOGS_STORAGE_SHARDS)]
+_logs_first_seen = itertools.count()
+_logs_count = 0  # Apps stored across all shards
+_logs_count_lock = threading.Lock()
+_logs_evict_lock = threading.Lock()
 
 
 def log_message(direction, endpoint, data, status=None):
     """Record a message to the in-memory log.
 
     direction: 'received' or 'sent'
+
+    The timestamp is stored as integer nanoseconds and only formatted when
+    the messages page is rendered. The data is serialized to pretty JSON
+    and HTML-escaped once here rather than on every page view.
     """
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "direction": direction,
-        "endpoint": endpoint,
-        "data": data,
-    }
-    if status is not None:
-        entry["status"] = status
-    message_log.append(entry)
+    message_log.append(LogEntry(
+        time.time_ns(),
+        escape(direction),
+        escape(endpoint),
+        escape(app.json.dumps(data, indent=2)),
+        status,
+    ))
+
+
+def isotime(timestamp_ns):
+    """Format a time.time_ns() timestamp as an ISO 8601 UTC string."""
+    iso = datetime.fromtimestamp(timestamp_ns / 1e9, timezone.utc).isoformat()
+    return Markup(iso)  # Digits and -:.+T only, nothing to escape
+
+
+jinja_env.filters["isotime"] = isotime
+
+
+def utc_now_iso():
+    """Return the current time as an ISO 8601 UTC string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _logs_shard(app_name):
+    return logs_shards[hash(app_name) % LOGS_STORAGE_SHARDS]
+
+
+def store_logs(app_name, entry, replace_sources=None):
+    """Store the log entry for an app, evicting the oldest app when full.
+
+    Apps keep their original position when their logs are replaced, so the
+    logs list stays in first-seen order. If replace_sources is given, the
+    entry is only stored over an existing entry with one of those sources.
+    Returns whether the entry was stored. The app name is HTML-escaped once
+    here for the logs list page.
+    """
+    global _logs_count
+    entry["app_name_html"] = escape(app_name)
+    shard, lock = _logs_shard(app_name)
+    with lock:
+        current = shard.get(app_name)
+        if replace_sources is not None:
+            if current is None or current[1].get("source") not in replace_sources:
+                return False
+        first_seen = current[0] if current else next(_logs_first_seen)
+        shard[app_name] = (first_seen, entry)
+    if current is None:
+        with _logs_count_lock:
+            _logs_count += 1
+            over_capacity = _logs_count > LOGS_STORAGE_SIZE
+        if over_capacity:
+            _evict_oldest_logs()
+    return True
+
+
+def _evict_oldest_logs():
+    """Evict the oldest apps across all shards until the total fits the cap.
+
+    Within a shard apps are ordered by first_seen, so the oldest app overall
+    is the earliest first entry among the shards.
+    """
+    global _logs_count
+    with _logs_evict_lock:
+        while _logs_count > LOGS_STORAGE_SIZE:
+            oldest = None
+            for shard, lock in logs_shards:
+                with lock:
+                    if not shard:
+                        continue
+                    app_name, (first_seen, _) = next(iter(shard.items()))
+                if oldest is None or first_seen < oldest[0]:
+                    oldest = (first_seen, app_name, shard, lock)
+            if oldest is None:
+                return
+            _, app_name, shard, lock = oldest
+            with lock:
+                removed = shard.pop(app_name, None) is not None
+            if removed:
+                with _logs_count_lock:
+                    _logs_count -= 1
+
+
+def get_logs(app_name):
+    """Return the stored log entry for an app, or None."""
+    shard, _ = _logs_shard(app_name)
+    stored = shard.get(app_name)
+    return stored[1] if stored else None
+
+
+def all_logs():
+    """Return a snapshot of every stored entry by app name, in first-seen order."""
+    items = []
+    for shard, lock in logs_shards:
+        with lock:
+            items.extend(shard.items())
+    items.sort(key=lambda item: item[1][0])
+    return {app_name: entry for app_name, (_, entry) in items}
 
 
 def get_api_token():
-    token = os.environ.get("KOYEB_API_TOKEN")
-    if not token:
+    if not KOYEB_API_TOKEN:
         raise RuntimeError("KOYEB_API_TOKEN environment variable not set")
-    return token
+    return KOYEB_API_TOKEN
 
 
 def koyeb_headers():
@@ -45,26 +265,69 @@ def koyeb_headers():
     }
 
 
+_koyeb_session = None
+_koyeb_session_lock = threading.Lock()
+
+
+def koyeb_session():
+    """Return the shared Koyeb API session, creating it on first use.
+
+    Reusing one session keeps connections to the Koyeb API alive between
+    calls instead of paying a new TCP+TLS handshake every time.
+    """
+    global _koyeb_session
+    if _koyeb_session is None:
+        with _koyeb_session_lock:
+            if _koyeb_session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+                session.headers.update(koyeb_headers())
+                _koyeb_session = session
+    return _koyeb_session
+
+
+_app_id_cache = {}  # app_name -> (app_id, expires_at)
+_app_id_cache_lock = threading.Lock()
+
+
 def resolve_app_id(app_name):
-    """Resolve an app name to a Koyeb app ID."""
-    resp = requests.get(
+    """Resolve an app name to a Koyeb app ID.
+
+    Successful lookups are cached for APP_ID_TTL seconds.
+    """
+    now = time.monotonic()
+    with _app_id_cache_lock:
+        cached = _app_id_cache.get(app_name)
+    if cached and cached[1] > now:
+        return cached[0], None
+
+    resp = koyeb_session().get(
         f"{KOYEB_API_BASE}/apps",
-        headers=koyeb_headers(),
         params={"name": app_name},
+        timeout=KOYEB_TIMEOUT,
     )
     resp.raise_for_status()
     apps = resp.json().get("apps", [])
     if not apps:
         return None, f"App '{app_name}' not found"
-    return apps[0]["id"], None
+    app_id = apps[0]["id"]
+    with _app_id_cache_lock:
+        _app_id_cache[app_name] = (app_id, now + APP_ID_TTL)
+    return app_id, None
+
+
+def forget_app_id(app_name):
+    """Drop a cached app ID, e.g. after the app is deleted."""
+    with _app_id_cache_lock:
+        _app_id_cache.pop(app_name, None)
 
 
 def get_service_id(app_id):
     """Get the first service ID for an app."""
-    resp = requests.get(
+    resp = koyeb_session().get(
         f"{KOYEB_API_BASE}/services",
-        headers=koyeb_headers(),
         params={"app_id": app_id},
+        timeout=KOYEB_TIMEOUT,
     )
     resp.raise_for_status()
     services = resp.json().get("services", [])
@@ -74,47 +337,124 @@ def get_service_id(app_id):
 
 
 def fetch_koyeb_logs(service_id, limit=5000):
-    """Fetch runtime logs from Koyeb's streaming logs API."""
-    try:
-        # Use the logs query endpoint
-        resp = requests.get(
-            f"{KOYEB_API_BASE}/streams/logs/query",
-            headers=koyeb_headers(),
-            params={
-                "service_id": service_id,
-                "type": "runtime",
-                "limit": limit,
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-
-        logs_data = resp.json()
-        logs_list = logs_data.get("logs", [])
-
-        # Combine log messages into a single string
-        log_lines = []
-        for entry in logs_list:
-            msg = entry.get("msg", "")
-            if msg:
-                log_lines.append(msg)
-
-        return "\n".join(log_lines)
-    except Exception as e:
-        logger.error(f"Failed to fetch logs from Koyeb: {e}")
-        return f"[Error fetching logs: {e}]"
+    """Fetch runtime logs from Koyeb's streaming logs API.
+
+    Request and HTTP errors are raised to the caller.
+    """
+    # Use the logs query endpoint
+    resp = koyeb_session().get(
+        f"{KOYEB_API_BASE}/streams/logs/query",
+        params={
+            "service_id": service_id,
+            "type": "runtime",
+            "limit": limit,
+        },
+        timeout=KOYEB_TIMEOUT,
+    )
+    resp.raise_for_status()
+
+    # Parse the raw body with orjson and join the messages directly,
+    # without building an intermediate list of lines
+    logs_list = orjson.loads(resp.content).get("logs", [])
+    return "\n".join(msg for entry in logs_list if (msg := entry.get("msg")))
 
 
 def delete_app(app_id):
     """Delete a Koyeb app by ID."""
-    resp = requests.delete(
-        f"{KOYEB_API_BASE}/apps/{app_id}",
-        headers=koyeb_headers(),
-    )
+    resp = koyeb_session().delete(f"{KOYEB_API_BASE}/apps/{app_id}", timeout=KOYEB_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
 
+def delete_app_by_name(app_name):
+    """Resolve an app name and delete the app.
+
+    Returns (app_id, error) like resolve_app_id. A 404 on delete means the
+    cached app ID was stale, so the name is resolved again and the delete
+    retried once. Other failures (5xx, timeouts) keep the cached ID.
+    """
+    for attempt in range(2):
+        app_id, error = resolve_app_id(app_name)
+        if error:
+            return None, error
+        try:
+            delete_app(app_id)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise  # Keep the cached ID so a retried /kill skips the lookup
+            forget_app_id(app_name)
+            if attempt == 0:
+                continue
+            raise
+        forget_app_id(app_name)
+        return app_id, None
+
+
+_log_pollers = set()  # App names with a running log poller
+_log_pollers_lock = threading.Lock()
+
+
+def start_log_poller(app_name):
+    """Start polling Koyeb for an app's logs, unless already polling it."""
+    if not LOG_POLL_INTERVAL or not KOYEB_API_TOKEN:
+        return
+    with _log_pollers_lock:
+        if app_name in _log_pollers:
+            return
+        _log_pollers.add(app_name)
+    threading.Thread(
+        target=poll_koyeb_logs, args=(app_name,), name=f"log-poller-{app_name}", daemon=True
+    ).start()
+
+
+def poll_koyeb_logs(app_name):
+    """Copy an app's runtime logs from Koyeb into the log store periodically.
+
+    Runs in a background thread so /logs/<app_name> never waits on Koyeb.
+    Stops once the app submits its own logs, its entry is evicted, the app
+    no longer exists, or LOG_POLL_MAX_FAILURES polls in a row fail.
+    """
+    app_id = service_id = None
+    failures = 0
+    try:
+        while failures < LOG_POLL_MAX_FAILURES:
+            time.sleep(LOG_POLL_INTERVAL)
+            entry = get_logs(app_name)
+            if entry is None or entry.get("source") not in POLLED_SOURCES:
+                return
+            try:
+                # Resolve on every poll (cached for APP_ID_TTL) so the poller
+                # notices when the app is deleted, e.g. by /kill
+                resolved_id, error = resolve_app_id(app_name)
+                if error:
+                    logger.info(f"Stopped polling logs for {app_name}: {error}")
+                    return
+                if resolved_id != app_id:
+                    app_id, service_id = resolved_id, None
+                if service_id is None:
+                    service_id = get_service_id(app_id)
+                    if service_id is None:
+                        continue
+                logs = fetch_koyeb_logs(service_id)
+            except Exception as e:
+                failures += 1
+                logger.error(f"Failed to fetch logs from Koyeb for {app_name}: {e}")
+                continue
+            failures = 0
+            if not logs:
+                continue
+            stored = store_logs(app_name, {
+                "timestamp": utc_now_iso(),
+                "logs": logs.encode(),
+                "source": "koyeb_api",
+            }, replace_sources=POLLED_SOURCES)
+            if not stored:
+                return
+    finally:
+        with _log_pollers_lock:
+            _log_pollers.discard(app_name)
+
+
 @app.route("/health", methods=["GET"])
 def health():
     return jsonify({"status": "ok"}), 200
@@ -157,38 +497,38 @@ def kill():
     logger.info(f"Kill requested for app: {app_name}")
     log_message("received", "/kill", data)
 
-    # Resolve app name to ID
-    app_id, error = resolve_app_id(app_name)
-    if error:
-        logger.error(f"Failed to resolve app: {error}")
-        response = {"status": "error", "app_name": app_name, "message": error}
-        log_message("sent", "/kill", response, status=404)
-        return jsonify(response), 404
-
-    # Delete the app
+    # Resolve app name to ID and delete the app
     try:
-        delete_app(app_id)
-        logger.info(f"Successfully deleted app: {app_name} (id: {app_id})")
-        response = {
-            "status": "deleted",
-            "app_name": app_name,
-            "app_id": app_id,
-        }
-        log_message("sent", "/kill", response, status=200)
-        return jsonify(response), 200
+        app_id, error = delete_app_by_name(app_name)
     except Exception as e:
         logger.error(f"Failed to delete app {app_name}: {e}")
         response = {"status": "error", "app_name": app_name, "message": str(e)}
         log_message("sent", "/kill", response, status=500)
         return jsonify(response), 500
 
+    if error:
+        logger.error(f"Failed to resolve app: {error}")
+        response = {"status": "error", "app_name": app_name, "message": error}
+        log_message("sent", "/kill", response, status=404)
+        return jsonify(response), 404
+
+    logger.info(f"Successfully deleted app: {app_name} (id: {app_id})")
+    response = {
+        "status": "deleted",
+        "app_name": app_name,
+        "app_id": app_id,
+    }
+    log_message("sent", "/kill", response, status=200)
+    return jsonify(response), 200
+
 
 @app.route("/init-logs", methods=["POST"])
 def init_logs():
     """Initialize log entry when a service first starts.
 
     Creates the log file immediately so the logs link is active right away,
-    before waiting for the first periodic /submit-logs update.
+    before waiting for the first periodic /submit-logs update. Until then,
+    a background poller refreshes it from Koyeb's runtime logs.
     """
     data = request.get_json()
     if not data:
@@ -202,7 +542,7 @@ def init_logs():
     start = data.get("start", "?")
     end = data.get("end", "?")
     instance_type = data.get("instance_type", "unknown")
-    started_at = data.get("started_at", datetime.now(timezone.utc).isoformat())
+    started_at = data.get("started_at") or utc_now_iso()
 
     logger.info(f"Init logs for app: {app_name} (model={model}, {start}-{end}, {instance_type})")
     log_message("received", "/init-logs", data)
@@ -214,11 +554,12 @@ def init_logs():
         f"\nWaiting for logs...\n"
     )
 
-    logs_storage[app_name] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "logs": init_text,
+    store_logs(app_name, {
+        "timestamp": utc_now_iso(),
+        "logs": init_text.encode(),
         "source": "init",
-    }
+    })
+    start_log_poller(app_name)
 
     response = {"status": "initialized", "app_name": app_name}
     log_message("sent", "/init-logs", response, status=200)
@@ -239,14 +580,16 @@ def submit_logs():
         return jsonify({"error": "app_name is required"}), 400
     if logs is None:
         return jsonify({"error": "logs field is required"}), 400
+    if not isinstance(logs, str):
+        return jsonify({"error": "logs must be a string"}), 400
 
     logger.info(f"Logs received for app: {app_name} ({len(logs)} chars)")
     log_message("received", "/submit-logs", {"app_name": app_name, "logs_length": len(logs)})
 
-    logs_storage[app_name] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "logs": logs,
-    }
+    store_logs(app_name, {
+        "timestamp": utc_now_iso(),
+        "logs": logs.encode(),  # Stored as UTF-8 so /logs-raw can send it as is
+    })
 
     response = {"status": "stored", "app_name": app_name}
     log_message("sent", "/submit-logs", response, status=200)
@@ -286,11 +629,11 @@ MESSAGES_TEMPLATE = """
         </tr>
         {% for msg in messages %}
         <tr>
-            <td>{{ msg.timestamp }}</td>
+            <td>{{ msg.timestamp | isotime }}</td>
             <td class="{{ msg.direction }}">{{ msg.direction }}</td>
             <td>{{ msg.endpoint }}</td>
             <td class="status-{{ msg.status or '' }}">{{ msg.status or '-' }}</td>
-            <td><pre>{{ msg.data | tojson(indent=2) }}</pre></td>
+            <td><pre>{{ msg.data_json }}</pre></td>
         </tr>
         {% endfor %}
     </table>
@@ -298,13 +641,24 @@ MESSAGES_TEMPLATE = """
 </html>
 """
 
+# Templates are compiled once at import; render_template_string re-parses
+# the source on every call.
+MESSAGES_TMPL = compile_template("messages.html", MESSAGES_TEMPLATE)
+MESSAGES_STREAM_BUFFER = 64  # Template fragments per streamed chunk
+
 
 @app.route("/messages", methods=["GET"])
 def messages():
-    """View all received and sent messages as an HTML page."""
-    return render_template_string(
-        MESSAGES_TEMPLATE, messages=message_log, count=len(message_log)
-    )
+    """View all received and sent messages as an HTML page.
+
+    The page is streamed row by row so the full HTML for a large log is
+    never held in memory at once.
+    """
+    messages = message_log.snapshot()
+    stream = MESSAGES_TMPL.stream(messages=messages, count=len(messages))
+    # Group Jinja's many small fragments so each write carries a few rows.
+    stream.enable_buffering(MESSAGES_STREAM_BUFFER)
+    return Response(stream_with_context(stream), mimetype="text/html")
 
 
 LOGS_LIST_TEMPLATE = """
@@ -330,9 +684,9 @@ LOGS_LIST_TEMPLATE = """
     <p class="count">{{ count }} app log(s) stored</p>
     {% if logs %}
     <ul>
-        {% for app_name, entry in logs.items() %}
+        {% for entry in logs.values() %}
         <li>
-            <a href="/logs/{{ app_name }}">{{ app_name }}</a>
+            <a href="/logs/{{ entry.app_name_html }}">{{ entry.app_name_html }}</a>
             <span class="timestamp">{{ entry.timestamp }}</span>
             {% if entry.source == 'koyeb_api' %}<span class="source">[fetched]</span>{% endif %}
         </li>
@@ -373,39 +727,43 @@ LOGS_VIEW_TEMPLATE = """
 </html>
 """
 
+# The not-found page has a single substitution, so it is kept as prebuilt
+# bytes around the escaped app name instead of going through Jinja.
+NOT_FOUND_PREFIX = b"""
+<!DOCTYPE html>
+<html>
+<head><title>Not Found</title>
+<style>body { font-family: monospace; margin: 2em; background: #1a1a2e; color: #eee; }
+a { color: #81c784; }</style></head>
+<body><h1>Logs not found for: """
+NOT_FOUND_SUFFIX = b"""</h1>
+<p><a href="/">Back to list</a></p></body>
+</html>
+"""
+
+LOGS_LIST_TMPL = compile_template("logs_list.html", LOGS_LIST_TEMPLATE)
+LOGS_VIEW_TMPL = compile_template("logs_view.html", LOGS_VIEW_TEMPLATE)
+
 
 @app.route("/", methods=["GET"])
 @app.route("/logs", methods=["GET"])
 def logs_list():
     """List all stored app logs."""
-    return render_template_string(
-        LOGS_LIST_TEMPLATE, logs=logs_storage, count=len(logs_storage)
-    )
+    logs = all_logs()
+    return LOGS_LIST_TMPL.render(logs=logs, count=len(logs))
 
 
 @app.route("/logs/<app_name>", methods=["GET"])
 def logs_view(app_name):
     """View logs for a specific app."""
-    if app_name not in logs_storage:
-        return render_template_string(
-            """
-            <!DOCTYPE html>
-            <html>
-            <head><title>Not Found</title>
-            <style>body { font-family: monospace; margin: 2em; background: #1a1a2e; color: #eee; }
-            a { color: #81c784; }</style></head>
-            <body><h1>Logs not found for: {{ app_name }}</h1>
-            <p><a href="/">Back to list</a></p></body>
-            </html>
-            """,
-            app_name=app_name,
-        ), 404
-    entry = logs_storage[app_name]
-    return render_template_string(
-        LOGS_VIEW_TEMPLATE,
+    entry = get_logs(app_name)
+    if entry is None:
+        body = NOT_FOUND_PREFIX + escape(app_name).encode() + NOT_FOUND_SUFFIX
+        return Response(body, status=404, mimetype="text/html")
+    return LOGS_VIEW_TMPL.render(
         app_name=app_name,
         timestamp=entry["timestamp"],
-        logs=entry["logs"],
+        logs=entry["logs"].decode(),
         source=entry.get("source", "submitted"),
     )
 
@@ -413,10 +771,10 @@ def logs_view(app_name):
 @app.route("/logs-raw/<app_name>", methods=["GET"])
 def logs_raw(app_name):
     """Return raw logs as plain text (no HTML rendering)."""
-    if app_name not in logs_storage:
+    entry = get_logs(app_name)
+    if entry is None:
         return f"No logs found for: {app_name}\n", 404, {"Content-Type": "text/plain"}
-    entry = logs_storage[app_name]
-    return Response(entry["logs"], mimetype="text/plain")
+    return Response(entry["logs"], mimetype="text/plain")  # Already UTF-8 bytes
 
 
 if __name__ == "__main__":
@@ -105,7 +105,7 @@ koyeb services create web \
   --type web \
   --git "github.com/$GIT_REPO" \
   --git-branch "$GIT_BRANCH" \
-  --git-buildpack-run-command "gunicorn app:app" \
+  --git-buildpack-run-command "gunicorn app:app --workers 1 --worker-class gthread --threads 16" \
   --instance-type nano \
   --regions "$REGION" \
   --port 8000:http \